@@ -6,6 +6,7 @@ import typing as tp
 import zmq
 import zmq.asyncio as azmq
 
+from NaviNIBS.Devices import TimestampedToolPosition
 from NaviNIBS.Devices.ToolPositionsClient import ToolPositionsClient
 
 
@@ -29,3 +30,12 @@ class SimulatedToolPositionsClient(ToolPositionsClient):
             serverType = self._connector.get('type')
             if serverType != 'Simulated':
                 logger.error('Tried to use SimulatedToolPositionsClient to connect to non-simulated ToolPositionsServer')
+
+    def recordNewPositions_sync(self, positions: dict[str, TimestampedToolPosition]):
+        """
+        Record several new positions at once.
+
+        Note: the positions server does not (yet) have a bulk command, so this still sends one command per position.
+        """
+        for key, position in positions.items():
+            self.recordNewPosition_sync(key=key, position=position)
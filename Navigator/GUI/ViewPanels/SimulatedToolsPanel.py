@@ -10,7 +10,7 @@ import numpy as np
 import os
 import pyvista as pv
 import qtawesome as qta
-from qtpy import QtWidgets, QtGui
+from qtpy import QtWidgets, QtGui, QtCore
 import time
 import typing as tp
 
@@ -18,14 +18,15 @@ import typing as tp
 from NaviNIBS.Devices import TimestampedToolPosition
 from NaviNIBS_Simulated_Tools.Devices.SimulatedToolPositionsClient import SimulatedToolPositionsClient
 from NaviNIBS_Simulated_Tools.Navigator.Model.SimulatedToolsConfiguration import SimulatedTools as SimulatedToolsConfig, SimulatedToolPose
-from NaviNIBS.Navigator.Model.Session import SubjectTracker
+from NaviNIBS.Navigator.Model.Session import Tool, SubjectTracker
 from NaviNIBS.Navigator.GUI.Widgets.TrackingStatusWidget import TrackingStatusWidget
 from NaviNIBS.Navigator.GUI.ViewPanels.MainViewPanelWithDockWidgets import MainViewPanelWithDockWidgets
 from NaviNIBS.util.Asyncio import asyncTryAndLogExceptionOnError
 from NaviNIBS.util.json import jsonPrettyDumps
+from NaviNIBS.util.numpy import array_equalish
 from NaviNIBS.util.pyvista import Actor, setActorUserTransform
 from NaviNIBS.util.pyvista.PlotInteraction import pickActor, interactivelyMoveActor
-from NaviNIBS.util.Transforms import invertTransform, concatenateTransforms
+from NaviNIBS.util.Transforms import invertTransform
 from NaviNIBS.util.pyvista.plotting import BackgroundPlotter
 
 
@@ -40,14 +41,43 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
     _trackingStatusWdgt: TrackingStatusWidget = attrs.field(init=False)
     _plotter: BackgroundPlotter = attrs.field(init=False)
     _actors: tp.Dict[str, tp.Optional[Actor]] = attrs.field(init=False, factory=dict)
+    _actorKeyByActor: dict[int, str] = attrs.field(init=False, factory=dict)  # keyed by id(actor)
+    # actorKey -> (toolKey, kind), where kind is one of 'tracker', 'tool', 'subject'
+    _toolKeyByActorKey: dict[str, tuple[str, str]] = attrs.field(init=False, factory=dict)
+    # mirrors actor visibility, to avoid querying VTK on every update
+    _actorVisibility: dict[str, bool] = attrs.field(init=False, factory=dict)
+    # toolKey -> ((actorKey, kind), ...)
+    _actorKeysByToolKey: dict[str, tuple[tuple[str, str], ...]] = attrs.field(init=False, factory=dict)
 
     _currentlyMovingActors: set[str] = attrs.field(init=False, factory=set)
 
+    # per actor: (stlToTrackerTransf, trackerToWorldTransf, composed) from last composition
+    _composedTransfCache: dict[str, tuple[np.ndarray, np.ndarray, np.ndarray]] = attrs.field(init=False, factory=dict)
+    _lastPushedTransf: dict[str, np.ndarray] = attrs.field(init=False, factory=dict)
+    # per tool: (toolStlToTrackerTransf, trackerStlToTrackerTransf), invalidated in _onToolsChanged
+    _staticTransfsCache: dict[str, tuple[np.ndarray | None, np.ndarray | None]] = attrs.field(init=False, factory=dict)
+    # (trackerToMRITransf, MRIToTrackerTransf)
+    _MRIToTrackerTransfCache: tuple[np.ndarray, np.ndarray] | None = attrs.field(init=False, default=None)
+
     _positionsClient: SimulatedToolPositionsClient = attrs.field(init=False)
 
     _hasRestoredPositions: bool = attrs.field(init=False, default=False)
+    _isRebuildingActors: bool = attrs.field(init=False, default=False)
+
+    # positions queued to be sent to the positions server, latest per key
+    _pendingPositions: dict[str, TimestampedToolPosition] = attrs.field(init=False, factory=dict)
+    _sendPendingPositionsTask: asyncio.Task | None = attrs.field(init=False, default=None)
+
+    # used to coalesce bursts of position updates into at most one update per frame
+    _updateTimer: QtCore.QTimer = attrs.field(init=False)
+    _updateInterval: int = 16  # in ms
 
     def __attrs_post_init__(self):
+        self._updateTimer = QtCore.QTimer()
+        self._updateTimer.setSingleShot(True)
+        self._updateTimer.setInterval(self._updateInterval)
+        self._updateTimer.timeout.connect(self._updateFromLatestPositions)
+
         super().__attrs_post_init__()
 
     @property
@@ -57,6 +87,9 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
     def _onSessionSet(self):
         super()._onSessionSet()
 
+        self._actorKeysByToolKey.clear()
+        self._staticTransfsCache.clear()
+
         # initialize right away so will start listening to pose updates
         self._positionsClient = SimulatedToolPositionsClient(
             serverHostname=self.session.tools.positionsServerInfo.hostname,
@@ -66,7 +99,7 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
         # TODO: reconnect positions client if positionsServerInfo changes later
         self._positionsClient.sigLatestPositionsChanged.connect(self._onLatestPositionsChanged)
 
-        self._onLatestPositionsChanged()
+        self._updateFromLatestPositions()
 
 
     def canBeEnabled(self) -> tuple[bool, str | None]:
@@ -93,29 +126,29 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
         self._wdgt.addDock(dock, position='bottom')
 
         btn = QtWidgets.QPushButton('Clear all positions')
-        btn.clicked.connect(lambda checked: self.clearAllPositions())
+        btn.clicked.connect(self._onClearAllPositionsClicked)
         container.layout().addWidget(btn)
 
         btn = QtWidgets.QPushButton('Zero all positions')
-        btn.clicked.connect(lambda checked: self.zeroAllPositions())
+        btn.clicked.connect(self._onZeroAllPositionsClicked)
         container.layout().addWidget(btn)
 
         btn = QtWidgets.QPushButton('Move tool...')
-        btn.clicked.connect(lambda checked: self.selectToolToMove())
+        btn.clicked.connect(self._onMoveToolClicked)
         container.layout().addWidget(btn)
 
         btn = QtWidgets.QPushButton('Clear tool position...')
-        btn.clicked.connect(lambda checked: self.selectToolToClearPos())
+        btn.clicked.connect(self._onClearToolPosClicked)
         container.layout().addWidget(btn)
 
         container.layout().addSpacing(10)
 
         btn = QtWidgets.QPushButton('Import positions snapshot...')
-        btn.clicked.connect(lambda checked: asyncio.create_task(asyncTryAndLogExceptionOnError(self.importPositionsSnapshot)))
+        btn.clicked.connect(self._onImportPositionsSnapshotClicked)
         container.layout().addWidget(btn)
 
         btn = QtWidgets.QPushButton('Export positions snapshot...')
-        btn.clicked.connect(lambda checked: asyncio.create_task(asyncTryAndLogExceptionOnError(self.exportPositionsSnapshot)))
+        btn.clicked.connect(self._onExportPositionsSnapshotClicked)
         container.layout().addWidget(btn)
 
         container.layout().addStretch()
@@ -124,9 +157,8 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
 
         self._plotter = BackgroundPlotter()
         self._plotter.enable_depth_peeling(3)
-        if False:
-            # (disabled for now, breaks mesh picking)
-            self._plotter.add_axes_at_origin(labels_off=True, line_width=4)
+        # (axes at origin disabled for now, breaks mesh picking)
+        # self._plotter.add_axes_at_origin(labels_off=True, line_width=4)
         dock, container = self._createDockWidget(
             title='Simulated tools view',
             widget=self._plotter
@@ -134,48 +166,173 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
         self._wdgt.addDock(dock, position='right')
 
         self._trackingStatusWdgt.session = self.session
-        self._onLatestPositionsChanged()
+        self._updateFromLatestPositions()
 
         self._session.tools.sigItemsChanged.connect(self._onToolsChanged)
 
-        if True == False:
+    def _composedFor(self, actorKey: str, stlToTrackerTransf: np.ndarray, trackerToWorldTransf: np.ndarray) -> np.ndarray:
+        """
+        Compose stl->tracker and tracker->world transforms, reusing the previous result for this actor if neither input
+        array has been replaced since.
+        """
+        cached = self._composedTransfCache.get(actorKey, None)
+        if cached is not None and cached[0] is stlToTrackerTransf and cached[1] is trackerToWorldTransf:
+            return cached[2]
+        composed = trackerToWorldTransf @ stlToTrackerTransf
+        self._composedTransfCache[actorKey] = (stlToTrackerTransf, trackerToWorldTransf, composed)
+        return composed
+
+    def _getStaticTransfs(self, toolKey: str, tool: Tool) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """
+        Get (toolStlToTrackerTransf, trackerStlToTrackerTransf) for a tool as float64 C-contiguous arrays.
+
+        Results are cached until the tool changes (see _onToolsChanged).
+        """
+        try:
+            return self._staticTransfsCache[toolKey]
+        except KeyError:
             pass
 
+        toolToTrackerTransf = tool.toolToTrackerTransf
+        toolStlToToolTransf = tool.toolStlToToolTransf
+        trackerStlToTrackerTransf = tool.trackerStlToTrackerTransf
+        if toolToTrackerTransf is None:
+            toolStlToTrackerTransf = None
+        else:
+            toolStlToTrackerTransf = np.ascontiguousarray(toolToTrackerTransf @ toolStlToToolTransf, dtype=np.float64)
+        if trackerStlToTrackerTransf is not None:
+            trackerStlToTrackerTransf = np.ascontiguousarray(trackerStlToTrackerTransf, dtype=np.float64)
+
+        staticTransfs = (toolStlToTrackerTransf, trackerStlToTrackerTransf)
+        self._staticTransfsCache[toolKey] = staticTransfs
+        return staticTransfs
+
+    def _getMRIToTrackerTransf(self, trackerToMRITransf: np.ndarray) -> np.ndarray:
+        cached = self._MRIToTrackerTransfCache
+        if cached is not None and cached[0] is trackerToMRITransf:
+            return cached[1]
+        MRIToTrackerTransf = invertTransform(trackerToMRITransf)
+        self._MRIToTrackerTransfCache = (trackerToMRITransf, MRIToTrackerTransf)
+        return MRIToTrackerTransf
+
+    def _getActorKeysForTool(self, toolKey: str, tool: Tool) -> tuple[tuple[str, str], ...]:
+        try:
+            return self._actorKeysByToolKey[toolKey]
+        except KeyError:
+            pass
+        kinds = ('tracker', 'tool', 'subject') if isinstance(tool, SubjectTracker) else ('tracker', 'tool')
+        actorKeys = tuple((toolKey + '_' + kind, kind) for kind in kinds)
+        self._actorKeysByToolKey[toolKey] = actorKeys
+        return actorKeys
+
+    def _addActor(self, actorKey: str, toolKey: str, kind: str, actor: Actor):
+        self._actors[actorKey] = actor
+        self._actorKeyByActor[id(actor)] = actorKey
+        self._toolKeyByActorKey[actorKey] = (toolKey, kind)
+        # new actors start visible, and always need their first transform pushed
+        self._actorVisibility[actorKey] = True
+        self._lastPushedTransf.pop(actorKey, None)
+
+    def _removeActor(self, actorKey: str):
+        actor = self._actors.pop(actorKey)
+        self._plotter.remove_actor(actor)
+        self._actorKeyByActor.pop(id(actor), None)
+        self._toolKeyByActorKey.pop(actorKey, None)
+        self._actorVisibility.pop(actorKey, None)
+        self._composedTransfCache.pop(actorKey, None)
+        self._lastPushedTransf.pop(actorKey, None)
+
+    def _setActorVisibility(self, actorKey: str, isVisible: bool) -> bool:
+        """
+        Returns True if the actor's visibility was changed.
+        """
+        if self._actorVisibility.get(actorKey, None) == isVisible:
+            return False
+        if isVisible:
+            self._actors[actorKey].VisibilityOn()
+        else:
+            self._actors[actorKey].VisibilityOff()
+        self._actorVisibility[actorKey] = isVisible
+        return True
+
+    def _pushActorTransf(self, actorKey: str, transf: np.ndarray) -> bool:
+        """
+        Apply transf to actor, skipping the VTK update if it (approximately) matches what was last applied.
+
+        Returns True if the actor's transform was changed.
+        """
+        prevTransf = self._lastPushedTransf.get(actorKey, None)
+        if prevTransf is not None and array_equalish(prevTransf, transf):
+            return False
+        setActorUserTransform(self._actors[actorKey], transf)
+        self._lastPushedTransf[actorKey] = transf.copy()
+        return True
+
+    def _onClearAllPositionsClicked(self, checked: bool):
+        self.clearAllPositions()
+
+    def _onZeroAllPositionsClicked(self, checked: bool):
+        self.zeroAllPositions()
+
+    def _onMoveToolClicked(self, checked: bool):
+        self.selectToolToMove()
+
+    def _onClearToolPosClicked(self, checked: bool):
+        self.selectToolToClearPos()
+
+    def _onImportPositionsSnapshotClicked(self, checked: bool):
+        asyncio.create_task(asyncTryAndLogExceptionOnError(self.importPositionsSnapshot))
+
+    def _onExportPositionsSnapshotClicked(self, checked: bool):
+        asyncio.create_task(asyncTryAndLogExceptionOnError(self.exportPositionsSnapshot))
+
     def _onToolsChanged(self, toolKeysChanged: tp.List[str], changedAttribs: tp.Optional[list[str]] = None):
+        if not toolKeysChanged:
+            toolKeysChanged = list(self.session.tools.keys())
+
         didRemove = False
-        for key, tool in self.session.tools.items():
-            actorKeysForTool = [key + '_tracker', key + '_tool']
-            for actorKey in actorKeysForTool:
+        for key in toolKeysChanged:
+            self._staticTransfsCache.pop(key, None)
+            self._actorKeysByToolKey.pop(key, None)
+            for kind in ('tracker', 'tool', 'subject'):
+                actorKey = key + '_' + kind
                 if actorKey in self._actors:
-                    self._plotter.remove_actor(self._actors[actorKey])
-                    self._actors.pop(actorKey)
+                    self._removeActor(actorKey)
                     didRemove = True
 
         if didRemove:
-            self._onLatestPositionsChanged()
+            self._updateFromLatestPositions()
 
     def _onLatestPositionsChanged(self):
+        # defer update so that multiple position changes in quick succession only trigger one update
+        if not self._updateTimer.isActive():
+            self._updateTimer.start()
+
+    def _updateFromLatestPositions(self):
+        self._syncConfigPoses()
 
+        if not self._hasInitialized and not self.isInitializing:
+            return
+
+        self._rebuildActors()
+
+    def _syncConfigPoses(self):
         config: SimulatedToolsConfig = self.session.addons['NaviNIBS_Simulated_Tools'].SimulatedTools
 
         if not self._hasRestoredPositions:
             # restore previously-saved positions on startup
-            for trackerKey, pose in config.poses.items():
-                if pose.transf is None:
-                    continue
-
-                # only restore positions without a position already set
-                try:
-                    self._positionsClient.getLatestTransf(trackerKey)
-                except KeyError as e:
-                    # TODO: maybe make this async, after verifying won't cause concurrency problems
-                    self._positionsClient.recordNewPosition_sync(
-                        key=trackerKey,
-                        position=TimestampedToolPosition(
-                            time=time.time(),
-                            transf=pose.transf,
-                            relativeTo=pose.relativeTo,
-                        ))
+            # (only restore positions without a position already set)
+            now = time.time()
+            toRestore = {trackerKey: TimestampedToolPosition(
+                                time=now,
+                                transf=pose.transf,
+                                relativeTo=pose.relativeTo)
+                         for trackerKey, pose in config.poses.items()
+                         if pose.transf is not None
+                         and self._positionsClient.getLatestTransf(trackerKey, None) is None}
+            if len(toRestore) > 0:
+                # TODO: maybe make this async, after verifying won't cause concurrency problems
+                self._positionsClient.recordNewPositions_sync(toRestore)
 
             self._hasRestoredPositions = True
 
@@ -189,103 +346,128 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
                     config.poses[tool.trackerKey] = SimulatedToolPose(key=tool.trackerKey)
                 config.poses[tool.trackerKey].transf = transf
 
-        if not self._hasInitialized and not self.isInitializing:
+    def _rebuildActors(self):
+        if self._isRebuildingActors:
+            # try again after current rebuild finishes
+            self._updateTimer.start()
             return
 
-        doResetCamera = False
+        self._isRebuildingActors = True
+        try:
+            doResetCamera = False
+            needsRender = False
 
-        for key, tool in self.session.tools.items():
-            if True == False:
-                logger.debug('TODO: delete')
-            actorKeysForTool = [key + '_tracker', key + '_tool']
-            if isinstance(tool, SubjectTracker):
-                actorKeysForTool.append(key + '_subject')
-
-            if not tool.isActive or self._positionsClient.getLatestTransf(tool.trackerKey, None) is None:
-                # no valid position available
-                for actorKey in actorKeysForTool:
-                    if actorKey in self._actors and self._actors[actorKey].GetVisibility():
-                        self._actors[actorKey].VisibilityOff()
-                continue
+            for key, tool in self.session.tools.items():
+                actorKeysForTool = self._getActorKeysForTool(key, tool)
 
-            for actorKey in actorKeysForTool:
-                #logger.debug(f'actorKey: {actorKey}')
+                trackerKey = tool.trackerKey
+                trackerTransf = self._positionsClient.getLatestTransf(trackerKey, None)
+                hasPose = trackerTransf is not None
 
-                if actorKey in self._currentlyMovingActors:
-                    # don't update position of currently moving actor to avoid "flickering"
+                if not tool.isActive or not hasPose:
+                    # no valid position available
+                    for actorKey, _ in actorKeysForTool:
+                        if actorKey in self._actors and self._setActorVisibility(actorKey, False):
+                            needsRender = True
                     continue
 
-                doShow = False
-                for toolOrTracker in ('tracker', 'tool'):
-                    if actorKey == (key + '_' + toolOrTracker):
-                        if getattr(tool, 'doRender' + toolOrTracker.capitalize()) is False:
-                            doShow = False
-                        else:
-                            if getattr(tool, toolOrTracker + 'StlFilepath') is not None:
-                                if toolOrTracker == 'tool':
-                                    if tool.toolToTrackerTransf is None:
-                                        toolOrTrackerStlToTrackerTransf = None
-                                    else:
-                                        toolOrTrackerStlToTrackerTransf = tool.toolToTrackerTransf @ tool.toolStlToToolTransf
-                                elif toolOrTracker == 'tracker':
-                                    toolOrTrackerStlToTrackerTransf = tool.trackerStlToTrackerTransf
-                                else:
-                                    raise NotImplementedError()
-                                if toolOrTrackerStlToTrackerTransf is not None:
-                                    doShow = True
-                                    if actorKey not in self._actors:
-                                        # initialize graphic
-                                        mesh = getattr(tool, toolOrTracker + 'Surf')
-                                        meshColor = tool.trackerColor if toolOrTracker == 'tracker' else tool.toolColor
-                                        meshOpacity = tool.trackerOpacity if toolOrTracker == 'tracker' else tool.toolOpacity
-
-                                        self._actors[actorKey] = self._plotter.addMesh(mesh=mesh,
-                                                                                       color=meshColor,
-                                                                                       defaultMeshColor='#444444',
-                                                                                       opacity=1.0 if meshOpacity is None else meshOpacity,
-                                                                                       name=actorKey)
-
-                                        doResetCamera = True
-
-                                    # apply transform to existing actor
-                                    setActorUserTransform(self._actors[actorKey],
-                                                          concatenateTransforms([
-                                                              toolOrTrackerStlToTrackerTransf,
-                                                              self._positionsClient.getLatestTransf(tool.trackerKey)
-                                                          ]))
-                                    self._plotter.render()
-                            else:
-                                # TODO: show some generic graphic to indicate tool position, even when we don't have an stl for the tool
-                                doShow = False
+                toolStlToTrackerTransf, trackerStlToTrackerTransf = self._getStaticTransfs(key, tool)
+
+                for actorKey, kind in actorKeysForTool:
+                    #logger.debug(f'actorKey: {actorKey}')
+
+                    if actorKey in self._currentlyMovingActors:
+                        # don't update position of currently moving actor to avoid "flickering"
+                        continue
+
+                    doShow = False
+                    stlToTrackerTransf = None
+                    # TODO: show some generic graphic to indicate tool position, even when we don't have an stl for the tool
+                    if kind == 'tracker':
+                        if tool.doRenderTracker is not False and tool.trackerStlFilepath is not None:
+                            stlToTrackerTransf = trackerStlToTrackerTransf
+                    elif kind == 'tool':
+                        if tool.doRenderTool is not False and tool.toolStlFilepath is not None:
+                            stlToTrackerTransf = toolStlToTrackerTransf
 
-                if isinstance(tool, SubjectTracker) and actorKey == tool.key + '_subject':
-                    if self.session.subjectRegistration.trackerToMRITransf is not None and self.session.headModel.skinSurf is not None:
+                    if stlToTrackerTransf is not None:
                         doShow = True
                         if actorKey not in self._actors:
-                            self._actors[actorKey] = self._plotter.add_mesh(mesh=self.session.headModel.skinSurf,
-                                                                            color='#d9a5b2',
-                                                                            opacity=0.8,
-                                                                            name=actorKey)
-                            doResetCamera = True
-
-                        setActorUserTransform(self._actors[actorKey],
-                                              self._positionsClient.getLatestTransf(tool.trackerKey) @ invertTransform(self.session.subjectRegistration.trackerToMRITransf))
-                        self._plotter.render()
+                            # initialize graphic
+                            if kind == 'tracker':
+                                mesh, meshColor, meshOpacity = tool.trackerSurf, tool.trackerColor, tool.trackerOpacity
+                            else:
+                                mesh, meshColor, meshOpacity = tool.toolSurf, tool.toolColor, tool.toolOpacity
 
-                if actorKey in self._actors:
-                    if doShow and not self._actors[actorKey].GetVisibility():
-                        self._actors[actorKey].VisibilityOn()
-                        self._plotter.render()
-                    elif not doShow and self._actors[actorKey].GetVisibility():
-                        self._actors[actorKey].VisibilityOff()
-                        self._plotter.render()
+                            self._addActor(actorKey, key, kind,
+                                           self._plotter.addMesh(mesh=mesh,
+                                                                 color=meshColor,
+                                                                 defaultMeshColor='#444444',
+                                                                 opacity=1.0 if meshOpacity is None else meshOpacity,
+                                                                 name=actorKey))
 
-        if doResetCamera:
-            pass  # self._plotter.reset_camera()
+                            doResetCamera = True
+                            needsRender = True
+
+                        # apply transform to existing actor
+                        if self._pushActorTransf(actorKey, self._composedFor(actorKey, stlToTrackerTransf, trackerTransf)):
+                            needsRender = True
+
+                    elif kind == 'subject':
+                        trackerToMRITransf = self.session.subjectRegistration.trackerToMRITransf
+                        if trackerToMRITransf is not None and self.session.headModel.skinSurf is not None:
+                            doShow = True
+                            if actorKey not in self._actors:
+                                self._addActor(actorKey, key, 'subject',
+                                               self._plotter.add_mesh(mesh=self.session.headModel.skinSurf,
+                                                                      color='#d9a5b2',
+                                                                      opacity=0.8,
+                                                                      name=actorKey))
+                                doResetCamera = True
+                                needsRender = True
+
+                            if self._pushActorTransf(actorKey,
+                                                     self._composedFor(
+                                                         actorKey,
+                                                         self._getMRIToTrackerTransf(trackerToMRITransf),
+                                                         trackerTransf)):
+                                needsRender = True
+
+                    if actorKey in self._actors and self._setActorVisibility(actorKey, doShow):
+                        needsRender = True
+
+            if doResetCamera:
+                pass  # self._plotter.reset_camera()
+
+            if needsRender:
+                self._plotter.render()
+        finally:
+            self._isRebuildingActors = False
+
+    def _submitNewPosition(self, key: str, position: TimestampedToolPosition):
+        """
+        Queue a new position to be sent to the positions server without blocking the GUI.
+
+        If an earlier position for the same key is still waiting to be sent, it is replaced.
+        """
+        self._pendingPositions[key] = position
+        if self._sendPendingPositionsTask is None or self._sendPendingPositionsTask.done():
+            self._sendPendingPositionsTask = asyncio.create_task(
+                asyncTryAndLogExceptionOnError(self._sendPendingPositions))
+
+    async def _waitForPendingPositionsSent(self):
+        if self._sendPendingPositionsTask is not None:
+            await self._sendPendingPositionsTask
+
+    async def _sendPendingPositions(self):
+        while len(self._pendingPositions) > 0:
+            key = next(iter(self._pendingPositions))
+            position = self._pendingPositions.pop(key)
+            await self._positionsClient.recordNewPosition_async(key=key, position=position)
 
     def clearAllPositions(self):
         for key, tool in self.session.tools.items():
-            self._positionsClient.recordNewPosition_sync(
+            self._submitNewPosition(
                 key=tool.trackerKey,
                 position=TimestampedToolPosition(
                     time=time.time(),
@@ -295,17 +477,16 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
 
     def zeroAllPositions(self):
         for key, tool in self.session.tools.items():
-            if True:
-                # only zero positions for tools that don't have positions defined relative to another tool
-                pos = self._positionsClient.latestPositions.get(tool.trackerKey, None)
-                if pos is not None and pos.relativeTo is not None:
-                    continue
+            # only zero positions for tools that don't have positions defined relative to another tool
+            pos = self._positionsClient.latestPositions.get(tool.trackerKey, None)
+            if pos is not None and pos.relativeTo is not None:
+                continue
 
-            self._positionsClient.recordNewPosition_sync(key=tool.trackerKey,
-                                                         position=TimestampedToolPosition(
-                                                                time=time.time(),
-                                                                transf=np.eye(4),
-                                                         ))
+            self._submitNewPosition(key=tool.trackerKey,
+                                    position=TimestampedToolPosition(
+                                        time=time.time(),
+                                        transf=np.eye(4),
+                                    ))
 
     async def importPositionsSnapshot(self, filepath: str | None = None, positionsDict: dict[str, dict] | None = None):
 
@@ -322,21 +503,20 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
                 logger.warning('Import cancelled')
                 return
 
-            with open(filepath, 'r') as f:
-                positionsDict: dict[str, dict] = json.load(f)
-        else:
-            positionsDict = positionsDict.copy()
+            def readSnapshot() -> dict[str, dict]:
+                with open(filepath, 'r') as f:
+                    return json.load(f)
 
-        for key in positionsDict.keys():
-            positionsDict[key] = TimestampedToolPosition.fromDict(positionsDict[key])
+            positionsDict: dict[str, dict] = await asyncio.to_thread(readSnapshot)
 
-        for key, tsPos in positionsDict.items():
-            tsPos.time = time.time()  # overwrite old time to make this look like a "new" position
+        now = time.time()
+        for key, tsPosDict in positionsDict.items():
+            tsPos = TimestampedToolPosition.fromDict(tsPosDict)
+            tsPos.time = now  # overwrite old time to make this look like a "new" position
             logger.info('Setting position for ' + key + ' to ' + str(tsPos.transf))
-            if True:
-                await self._positionsClient.recordNewPosition_async(key=key, position=tsPos)
-            else:
-                self._positionsClient.recordNewPosition_sync(key=key, position=tsPos)
+            self._submitNewPosition(key=key, position=tsPos)
+
+        await self._waitForPendingPositionsSent()
 
     async def exportPositionsSnapshot(self, filepath: str | None = None,
                                 doIncludeToolsWithRelativePositions: bool = False):
@@ -352,30 +532,31 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
             logger.warning('Export cancelled')
             return
 
-        positions = {key: tsPos.asDict() for key, tsPos in self._positionsClient.latestPositions.items()}
-
-        if not doIncludeToolsWithRelativePositions:
-            for key in list(positions.keys()):
-                tsPosDict = positions[key]
-                if tsPosDict.get('relativeTo', None) is not None:
-                    del positions[key]
+        positions = {key: tsPos.asDict() for key, tsPos in self._positionsClient.latestPositions.items()
+                     if tsPos is not None
+                     and (doIncludeToolsWithRelativePositions or tsPos.relativeTo == 'world')}
 
         toWrite = jsonPrettyDumps(positions)
-        with open(filepath, 'w') as f:
-            f.write(toWrite)
+
+        def writeSnapshot():
+            with open(filepath, 'w') as f:
+                f.write(toWrite)
+
+        await asyncio.to_thread(writeSnapshot)
 
         logger.info(f'Exported positions snapshot to {filepath}')
 
     async def clearToolPos(self, toolKey: str):
         logger.info(f'Clearing position of {toolKey}')
 
-        await self._positionsClient.recordNewPosition_async(
+        self._submitNewPosition(
             key=self.session.tools[toolKey].trackerKey,
             position=TimestampedToolPosition(
                 time=time.time(),
                 transf=None
             )
         )
+        await self._waitForPendingPositionsSent()
 
     async def selectAndClearToolPos(self, toolKey: str | None = None):
         if toolKey is None:
@@ -385,20 +566,14 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
                                           show_message='Left click on mesh to clear',
                                           style='wireframe',
                                           left_clicking=True)
-            try:
-                pickedKey = [actorKey for actorKey, actor in self._actors.items() if actor is pickedActor][0]
-            except IndexError as e:
+            pickedKey = self._actorKeyByActor.get(id(pickedActor), None)
+            if pickedKey is None:
                 logger.warning('Unrecognized actor picked. Cancelling select')
                 return
-            if pickedKey.endswith('_tracker'):
-                pickedTool = self.session.tools[pickedKey[:-len('_tracker')]]
-            elif pickedKey.endswith('_tool'):
-                pickedTool = self.session.tools[pickedKey[:-len('_tool')]]
-            else:
+            toolKey, pickedKind = self._toolKeyByActorKey[pickedKey]
+            if pickedKind not in ('tracker', 'tool'):
                 raise NotImplementedError
 
-            toolKey = pickedTool.key
-
         await self.clearToolPos(toolKey)
 
     async def selectAndMoveTool(self, pickedActor: Actor | None = None):
@@ -409,61 +584,58 @@ class SimulatedToolsPanel(MainViewPanelWithDockWidgets):
                                               show_message='Left click on mesh to move',
                                               style='wireframe',
                                               left_clicking=True)
-        try:
-            pickedKey = [actorKey for actorKey, actor in self._actors.items() if actor is pickedActor][0]
-        except IndexError as e:
+        pickedKey = self._actorKeyByActor.get(id(pickedActor), None)
+        if pickedKey is None:
             logger.warning('Unrecognized actor picked. Cancelling select and move')
             return
-        if pickedKey.endswith('_tracker'):
-            pickedTool = self.session.tools[pickedKey[:-len('_tracker')]]
-        elif pickedKey.endswith('_tool'):
-            pickedTool = self.session.tools[pickedKey[:-len('_tool')]]
-        else:
+        pickedToolKey, pickedKind = self._toolKeyByActorKey[pickedKey]
+        if pickedKind not in ('tracker', 'tool'):
             raise NotImplementedError
+        pickedTool = self.session.tools[pickedToolKey]
         logger.info(f'Picked actor {pickedKey} ({pickedTool.key}) to move')
 
+        # tool-specific transforms are constant for the duration of the move, so only invert them once
+        toolStlToTrackerTransf, trackerStlToTrackerTransf = self._getStaticTransfs(pickedToolKey, pickedTool)
+        if pickedKind == 'tool':
+            # actor transf is toolStlToWorldTransf
+            stlToTrackerTransf = toolStlToTrackerTransf
+        else:
+            # actor transf is trackerStlToWorldTransf
+            stlToTrackerTransf = trackerStlToTrackerTransf
+        trackerToStlTransf = invertTransform(stlToTrackerTransf)
+
         assert pickedKey not in self._currentlyMovingActors
         self._currentlyMovingActors.add(pickedKey)
 
         # move
+        # reused for every callback during the move to avoid reallocating
+        stlToWorldTransf = np.empty((4, 4), dtype=np.float64)
+
         def onNewTransf(transf: pv._vtk.vtkTransform):
             prevTransf = pickedActor.GetUserTransform()
             logger.debug('onNewTransf')
             # back out any tool-specific transforms and send updated transf to simulated tool position server
-            transf = pv.array_from_vtkmatrix(transf.GetMatrix())
-            if pickedKey.endswith('_tool'):
-                # transf is toolStlToWorldTransf
-                newTrackerToWorldTransf = concatenateTransforms([
-                    invertTransform(concatenateTransforms([
-                        pickedTool.toolStlToToolTransf,
-                        pickedTool.toolToTrackerTransf
-                    ])),
-                    transf,
-                ])
-            elif pickedKey.endswith('_tracker'):
-                # transf is trackerStlToWorldTransf
-                newTrackerToWorldTransf = concatenateTransforms([
-                    invertTransform(pickedTool.trackerStlToTrackerTransf),
-                    transf,
-                ])
-            else:
-                msg = f'Support for moving {pickedKey} not yet implemented'
-                logger.error(msg)
-                raise NotImplementedError(msg)
+            vtkMatrix = transf.GetMatrix()
+            for i in range(4):
+                for j in range(4):
+                    stlToWorldTransf[i, j] = vtkMatrix.GetElement(i, j)
+            newTrackerToWorldTransf = stlToWorldTransf @ trackerToStlTransf
 
             logger.info(f'Setting new simulated position: {newTrackerToWorldTransf}')
-            self._positionsClient.recordNewPosition_sync(
+            self._submitNewPosition(
                 key=pickedTool.trackerKey,
                 position=TimestampedToolPosition(
                     time=time.time(),
                     transf=newTrackerToWorldTransf
                 )
             )
-            logger.debug('Done setting new simulated position')
+            logger.debug('Queued new simulated position')
 
         await interactivelyMoveActor(plotter=self._plotter, actor=pickedActor, onNewTransf=onNewTransf)
 
         self._currentlyMovingActors.remove(pickedKey)
+        # actor's transform was changed interactively, so don't trust what we last applied
+        self._lastPushedTransf.pop(pickedKey, None)
 
         # TODO: cleanup here
 